@@ -1,22 +1,149 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+import base64
+from fastapi import APIRouter, HTTPException, Query, status, Depends
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from typing import List, Optional
 from bson import ObjectId
 from datetime import datetime, timezone
-from app.schemas.todo import TodoCreate, TodoUpdate, TodoResponse
+from app.schemas.todo import (
+    TodoCreate,
+    TodoUpdate,
+    TodoResponse,
+    TodoCompactResponse,
+    TodoStats,
+    TodoBoard,
+    TodoPriority,
+)
 from app.models.todo import Todo
+from app.core.counters import apply_increments, diff_increments, get_counters
 from app.core.database import get_database
+from app.core.reminders import deadline_scheduler
 from app.api.deps import get_current_user
 
 router = APIRouter()
 
+# Board column order, matching the frontend
+BOARD_PRIORITIES = [TodoPriority.urgent, TodoPriority.high, TodoPriority.medium, TodoPriority.low]
+EARLIEST = datetime.min.replace(tzinfo=timezone.utc)
 
-@router.get("/", response_model=List[TodoResponse])
-async def get_todos(current_user: dict = Depends(get_current_user)):
+
+def _encode_cursor(todo_doc: dict) -> str:
+    deadline = todo_doc.get("deadline")
+    raw = f"{deadline.isoformat() if deadline else ''}|{todo_doc['_id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[Optional[datetime], ObjectId]:
+    try:
+        deadline, _, todo_id = base64.urlsafe_b64decode(cursor.encode()).decode().partition("|")
+        return (datetime.fromisoformat(deadline) if deadline else None), ObjectId(todo_id)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def _board_group(db, user_id: str, priority: str, limit: int, cursor: Optional[str] = None) -> dict:
+    """One board column: active todos by deadline (no deadline last), then _id.
+
+    Both phases merge a few ordered ranges of the (user_id, priority, status,
+    deadline, _id) index, one per priority/status pair, so finished todos are
+    never read. Each range stops after `limit` + 1 entries; only legacy todos
+    without a status that are `completed` are read and then filtered out.
+    Legacy todos without a priority count as medium.
+    """
+    priorities = [priority, None] if priority == TodoPriority.medium else [priority]
+    active = {
+        "user_id": user_id,
+        "priority": {"$in": priorities},
+        "status": {"$in": ["not_started", "in_progress", None]},
+        "$nor": [{"status": None, "completed": True}],
+    }
+    after_deadline, after_id = _decode_cursor(cursor) if cursor else (None, None)
+    in_undated_phase = after_id is not None and after_deadline is None
+    docs = []
+
+    if not in_undated_phase:
+        if after_deadline is None:
+            dated = {**active, "deadline": {"$gte": EARLIEST}}
+        else:
+            dated = {**active, "$or": [
+                {"deadline": after_deadline, "_id": {"$gt": after_id}},
+                {"deadline": {"$gt": after_deadline}},
+            ]}
+        docs = list(
+            db.todos.find(dated).sort([("deadline", 1), ("_id", 1)]).limit(limit + 1)
+        )
+
+    if len(docs) <= limit:
+        undated = {**active, "deadline": None}
+        if in_undated_phase:
+            undated["_id"] = {"$gt": after_id}
+        docs += list(
+            db.todos.find(undated).sort([("deadline", 1), ("_id", 1)]).limit(limit + 1 - len(docs))
+        )
+
+    page = docs[:limit]
+    return {
+        "priority": priority,
+        "todos": [Todo.to_dict(todo) for todo in page],
+        "next_cursor": _encode_cursor(page[-1]) if len(docs) > limit else None,
+    }
+
+
+@router.get(
+    "/",
+    response_model=List[TodoResponse],
+    responses={200: {"description": "Full todos, or TodoCompactResponse items when compact=true"}},
+)
+async def get_todos(
+    compact: bool = False,
+    current_user: dict = Depends(get_current_user)
+):
     db = get_database()
     todos = list(db.todos.find({"user_id": str(current_user["_id"])}))
+
+    if compact:
+        items = [TodoCompactResponse.model_validate(Todo.to_dict(todo)) for todo in todos]
+        return JSONResponse(content=jsonable_encoder(items))
+
     return [Todo.to_dict(todo) for todo in todos]
 
 
+@router.get("/board", response_model=TodoBoard)
+async def get_board(
+    limit: int = Query(default=20, ge=1, le=100),
+    priority: Optional[TodoPriority] = None,
+    cursor: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """Active todos grouped by priority, deadline-ordered, `limit` per group.
+
+    Pass a group's `next_cursor` together with its `priority` to load more of that group.
+    """
+    if cursor and priority is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A cursor must be used with its priority"
+        )
+
+    db = get_database()
+    user_id = str(current_user["_id"])
+    priorities = [priority] if priority else BOARD_PRIORITIES
+    return {
+        "groups": [
+            _board_group(db, user_id, p.value, limit, cursor) for p in priorities
+        ]
+    }
+
+
+@router.get("/stats", response_model=TodoStats)
+async def get_todo_stats(current_user: dict = Depends(get_current_user)):
+    db = get_database()
+    return get_counters(db, str(current_user["_id"]))
+
+
 @router.post("/", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
 async def create_todo(
     todo: TodoCreate,
@@ -34,6 +161,8 @@ async def create_todo(
 
     result = db.todos.insert_one(todo_doc)
     todo_doc["_id"] = result.inserted_id
+    apply_increments(db, todo_doc["user_id"], diff_increments(None, todo_doc))
+    deadline_scheduler.schedule(todo_doc)
     return Todo.to_dict(todo_doc)
 
 
@@ -88,6 +217,8 @@ async def update_todo(
 
     db.todos.update_one({"_id": obj_id}, {"$set": updates})
     updated = db.todos.find_one({"_id": obj_id})
+    apply_increments(db, updated["user_id"], diff_increments(existing, updated))
+    deadline_scheduler.schedule(updated)
     return Todo.to_dict(updated)
 
 
@@ -106,15 +237,18 @@ async def delete_todo(
             detail="Invalid todo ID"
         )
 
-    result = db.todos.delete_one({
+    deleted = db.todos.find_one_and_delete({
         "_id": obj_id,
         "user_id": str(current_user["_id"])
     })
 
-    if result.deleted_count == 0:
+    if deleted is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Todo not found"
         )
 
+    apply_increments(db, deleted["user_id"], diff_increments(deleted, None))
+
+    deadline_scheduler.cancel(todo_id)
     return {"message": "Todo deleted successfully"}
@@ -18,6 +18,53 @@ class Settings(BaseSettings):
     # Server
     HOST: str = "0.0.0.0"
     PORT: int = 5000
+    # Proxies whose X-Forwarded-For is trusted for the client IP ("*" trusts any);
+    # rate limits on auth routes are keyed by that IP
+    FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+
+    # Production server (python -m app.serve)
+    WORKERS: int = 0  # 0 = one per CPU core
+    LOOP: str = "uvloop"
+    HTTP: str = "httptools"
+    KEEPALIVE_SECONDS: int = 5
+    BACKLOG: int = 2048
+    GRACEFUL_SHUTDOWN_SECONDS: int = 30
+    MAX_REQUESTS_PER_WORKER: int = 0  # recycle a worker after this many requests (0 = never)
+
+    # Background jobs (reminders, counter reconciliation) must run in one process only.
+    # BACKGROUND_JOBS runs them in the app lifespan; app.serve switches it off in its
+    # workers and, when JOBS_PROCESS is on, starts one `python -m app.jobs` process.
+    BACKGROUND_JOBS: bool = True
+    JOBS_PROCESS: bool = True
+
+    # Rate limiting
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" (per worker) or "mongo" (shared)
+    RATE_LIMIT_AUTH_BURST: int = 10
+    RATE_LIMIT_AUTH_PER_MINUTE: int = 10
+    RATE_LIMIT_TODOS_BURST: int = 60
+    RATE_LIMIT_TODOS_PER_MINUTE: int = 120
+
+    # Admission control: shed load once this many requests are in flight (0 disables)
+    MAX_IN_FLIGHT_REQUESTS: int = 200
+
+    # Deadline reminders
+    REMINDERS_ENABLED: bool = True
+    REMINDER_DUE_SOON_MINUTES: int = 60
+    REMINDER_HORIZON_HOURS: int = 24
+    REMINDER_MAX_PENDING: int = 100000
+
+    # Idempotency-Key handling for write routes
+    IDEMPOTENCY_BACKEND: str = "memory"  # "memory" (per worker LRU) or "mongo" (shared)
+    IDEMPOTENCY_TTL_HOURS: int = 24
+    IDEMPOTENCY_MAX_KEYS: int = 10000
+    IDEMPOTENCY_LOCK_SECONDS: int = 30  # how long a duplicate waits on the first attempt
+
+    # Response compression (brotli is used when installed and accepted, else gzip)
+    COMPRESSION_MIN_SIZE: int = 1024
+
+    # Per-user todo counters: repaired at startup, then every N minutes (0 = startup only)
+    COUNTER_RECONCILE_MINUTES: int = 60
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,178 @@
+# backend/app/core/counters.py
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from pymongo import ReturnDocument
+
+from app.core.database import get_database
+from app.models.todo import ACTIVE_TODO_FILTER, Todo
+
+STATUSES = ("not_started", "in_progress", "finished")
+PRIORITIES = ("low", "medium", "high", "urgent")
+
+BUCKET_SECONDS = 3600
+
+
+def _bucket(deadline: datetime) -> int:
+    if deadline.tzinfo is None:
+        deadline = deadline.replace(tzinfo=timezone.utc)
+    return int(deadline.timestamp()) // BUCKET_SECONDS
+
+
+def todo_increments(todo_doc: dict) -> dict:
+    """Counter fields a single todo contributes to its owner's counters document.
+
+    Open todos with a deadline are also counted in an hourly deadline bucket,
+    so overdue totals can be read without touching the todos themselves.
+    """
+    status = Todo.status(todo_doc)
+    inc = {"total": 1, f"status.{status}": 1}
+    if status != "finished":
+        inc["open"] = 1
+        inc[f"priority.{todo_doc.get('priority') or 'medium'}"] = 1
+        if todo_doc.get("deadline"):
+            inc[f"deadline_buckets.{_bucket(todo_doc['deadline'])}"] = 1
+    return inc
+
+
+def diff_increments(before: Optional[dict], after: Optional[dict]) -> dict:
+    """Increments that move the counters from `before` to `after` (either may be None)"""
+    inc = dict(todo_increments(after)) if after else {}
+    for field, value in (todo_increments(before) if before else {}).items():
+        inc[field] = inc.get(field, 0) - value
+    return {field: value for field, value in inc.items() if value}
+
+
+def _field(doc: dict, field: str) -> int:
+    group, _, key = field.partition(".")
+    if key:
+        return doc.get(group, {}).get(key, 0)
+    return doc.get(group, 0)
+
+
+def apply_increments(db, user_id: str, inc: dict):
+    """Atomically apply counter increments for one user.
+
+    Fields that drop to zero are removed, so the document only holds the hour
+    buckets that still have open todos and reads stay small.
+    """
+    if not inc:
+        return
+    before = db.todo_counters.find_one_and_update(
+        {"_id": user_id},
+        {"$inc": inc},
+        projection={field: 1 for field in inc},
+        upsert=True,
+        return_document=ReturnDocument.BEFORE,
+    )
+    if before is None:
+        # First write since counters existed: the increments started from zero,
+        # so count the user's todos (including this write) instead
+        reconcile_user(db, user_id)
+        return
+
+    zeroed = {field: 0 for field, value in inc.items() if _field(before, field) + value == 0}
+    if zeroed:
+        # Only while they are still zero; a concurrent write may have raised one again
+        db.todo_counters.update_one(
+            {"_id": user_id, **zeroed},
+            {"$unset": {field: "" for field in zeroed}},
+        )
+
+
+def _count_todos(db, user_id: str) -> dict:
+    """Rebuild a user's counters document from their todos"""
+    counters = {"_id": user_id}
+    cursor = db.todos.find(
+        {"user_id": user_id},
+        {"status": 1, "completed": 1, "priority": 1, "deadline": 1},
+    )
+    for todo in cursor:
+        for field, value in todo_increments(todo).items():
+            if "." in field:
+                group, key = field.split(".", 1)
+                counters.setdefault(group, {})
+                counters[group][key] = counters[group].get(key, 0) + value
+            else:
+                counters[field] = counters.get(field, 0) + value
+    return counters
+
+
+def reconcile_user(db, user_id: str) -> bool:
+    """Recount one user's todos and overwrite the counters if they drifted.
+
+    The recount never contains zeros, so leftover zero or empty fields count as
+    drift too and are cleared by the rewrite.
+    """
+    expected = _count_todos(db, user_id)
+    stored = db.todo_counters.find_one({"_id": user_id})
+    if stored == expected:
+        return False
+    db.todo_counters.replace_one({"_id": user_id}, expected, upsert=True)
+    return True
+
+
+def reconcile_counters(db=None) -> int:
+    """Detect and repair drift for every user; returns the number of users repaired.
+
+    A write racing with the recount can leave fresh drift behind; the next run picks it up.
+    """
+    db = db if db is not None else get_database()
+    user_ids = set(db.todos.distinct("user_id")) | set(db.todo_counters.distinct("_id"))
+    return sum(reconcile_user(db, user_id) for user_id in user_ids)
+
+
+def get_counters(db, user_id: str, now: Optional[datetime] = None) -> dict:
+    """Read a user's counters, resolving the overdue count from deadline buckets"""
+    now = now or datetime.now(timezone.utc)
+    doc = db.todo_counters.find_one({"_id": user_id})
+    if doc is None:
+        # First read for a user whose todos predate the counters
+        reconcile_user(db, user_id)
+        doc = db.todo_counters.find_one({"_id": user_id})
+
+    status = doc.get("status", {})
+    priority = doc.get("priority", {})
+    current = int(now.timestamp()) // BUCKET_SECONDS
+
+    overdue = 0
+    in_current_bucket = 0
+    for bucket, count in doc.get("deadline_buckets", {}).items():
+        if int(bucket) < current:
+            overdue += count
+        elif int(bucket) == current:
+            in_current_bucket = count
+
+    if in_current_bucket:
+        # Only the bucket containing "now" is ambiguous; settle it with a small index range read
+        overdue += db.todos.count_documents({
+            "user_id": user_id,
+            "deadline": {
+                "$gte": datetime.fromtimestamp(current * BUCKET_SECONDS, timezone.utc),
+                "$lt": now,
+            },
+            **ACTIVE_TODO_FILTER,
+        })
+
+    return {
+        "total": doc.get("total", 0),
+        "open": doc.get("open", 0),
+        "overdue": overdue,
+        "status": {name: status.get(name, 0) for name in STATUSES},
+        "priority": {name: priority.get(name, 0) for name in PRIORITIES},
+    }
+
+
+async def run_reconciliation(interval_seconds: float):
+    """Repair counter drift once at startup, then every `interval_seconds` (0 = only once)"""
+    while True:
+        try:
+            repaired = await asyncio.to_thread(reconcile_counters)
+            if repaired:
+                print(f"Repaired todo counters for {repaired} user(s)")
+        except Exception as e:
+            print(f"Counter reconciliation failed: {e}")
+        if not interval_seconds:
+            return
+        await asyncio.sleep(interval_seconds)
@@ -1,24 +1,33 @@
 # backend/app/core/database.py
+import os
 from pymongo import MongoClient
 from app.core.config import settings
 
 # MongoDB client
 client = None
 db = None
+client_pid = None  # process that opened the client; PyMongo clients are not fork-safe
 
 
 def connect_to_mongo():
     """Connect to MongoDB"""
-    global client, db
+    global client, db, client_pid
     try:
         client = MongoClient(settings.MONGODB_URI)
+        client_pid = os.getpid()
         db = client[settings.MONGODB_DB_NAME]  # explicit DB, no URI default needed
 
         # Create indexes
         db.users.create_index("email", unique=True)
         db.todos.create_index("user_id")
         db.todos.create_index([("user_id", 1), ("deadline", 1)])
-        db.todos.create_index([("user_id", 1), ("priority", 1), ("deadline", 1)])
+        db.todos.create_index("deadline")  # cross-user range scans for reminders
+        db.todos.create_index("updated_at")  # reminder scheduler's change feed
+        db.todos.create_index(
+            [("user_id", 1), ("priority", 1), ("status", 1), ("deadline", 1), ("_id", 1)]
+        )  # board columns; python -m app.migrate drops the index it replaced
+        db.rate_limits.create_index("expires_at", expireAfterSeconds=0)
+        db.idempotency_keys.create_index("expires_at", expireAfterSeconds=0)
 
         print("Connected to MongoDB successfully")
     except Exception as e:
@@ -29,11 +38,14 @@ def connect_to_mongo():
 def close_mongo_connection():
     """Close MongoDB connection"""
     global client
-    if client:
+    if client and client_pid == os.getpid():
         client.close()
         print("MongoDB connection closed")
 
 
 def get_database():
     """Get database instance"""
+    if client is not None and client_pid != os.getpid():
+        # Inherited across a fork: open this process's own client and pool
+        connect_to_mongo()
     return db
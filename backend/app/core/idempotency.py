@@ -0,0 +1,263 @@
+# backend/app/core/idempotency.py
+import asyncio
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse, Response
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+from app.core.database import get_database
+from app.core.rate_limit import client_key, rate_limit_for_path
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+PENDING = "pending"
+COMPLETED = "completed"
+
+
+class MemoryIdempotencyStore:
+    """LRU of recent responses kept in process memory (one per worker)"""
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._records: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            record = self._records.get(key)
+            if record is None:
+                return None
+            if record["expires_at"] <= time.time():
+                del self._records[key]
+                return None
+            self._records.move_to_end(key)
+            return record
+
+    def reserve(self, key: str, fingerprint: str, ttl: float) -> bool:
+        """Claim a key for execution; False if it is already pending or completed"""
+        with self._lock:
+            existing = self._records.get(key)
+            if existing is not None and existing["expires_at"] > time.time():
+                return False
+            self._records[key] = {
+                "state": PENDING,
+                "fingerprint": fingerprint,
+                "expires_at": time.time() + ttl,
+            }
+            self._evict()
+        return True
+
+    def _evict(self):
+        # Oldest completed responses go first; pending reservations must survive until done
+        while len(self._records) > self.max_keys:
+            victim = next(
+                (key for key, record in self._records.items() if record["state"] != PENDING),
+                None,
+            )
+            if victim is None:
+                return
+            del self._records[victim]
+
+    def complete(self, key: str, record: dict, ttl: float):
+        with self._lock:
+            self._records[key] = {**record, "state": COMPLETED, "expires_at": time.time() + ttl}
+            self._records.move_to_end(key)
+
+    def release(self, key: str):
+        with self._lock:
+            self._records.pop(key, None)
+
+    def reset(self):
+        with self._lock:
+            self._records.clear()
+
+
+class MongoIdempotencyStore:
+    """Responses in a shared, TTL-indexed MongoDB collection"""
+
+    collection_name = "idempotency_keys"
+
+    def _collection(self):
+        return get_database()[self.collection_name]
+
+    def get(self, key: str) -> Optional[dict]:
+        record = self._collection().find_one({"_id": key})
+        if record is None:
+            return None
+        expires_at = record["expires_at"]
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        # The TTL monitor only runs once a minute; don't trust expired records meanwhile
+        if expires_at <= datetime.now(timezone.utc):
+            return None
+        return record
+
+    def reserve(self, key: str, fingerprint: str, ttl: float) -> bool:
+        """Claim a key for execution; False if it is already pending or completed"""
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl)
+        collection = self._collection()
+        # Replace an expired leftover (e.g. a worker that died mid-request) before inserting
+        collection.delete_one({"_id": key, "expires_at": {"$lte": datetime.now(timezone.utc)}})
+        try:
+            collection.insert_one({
+                "_id": key,
+                "state": PENDING,
+                "fingerprint": fingerprint,
+                "expires_at": expires_at,
+            })
+            return True
+        except DuplicateKeyError:
+            return False
+
+    def complete(self, key: str, record: dict, ttl: float):
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl)
+        self._collection().update_one(
+            {"_id": key},
+            {"$set": {**record, "state": COMPLETED, "expires_at": expires_at}},
+        )
+
+    def release(self, key: str):
+        self._collection().delete_one({"_id": key, "state": PENDING})
+
+    def reset(self):
+        db = get_database()
+        if db is not None:
+            db[self.collection_name].delete_many({})
+
+
+memory_store = MemoryIdempotencyStore(settings.IDEMPOTENCY_MAX_KEYS)
+mongo_store = MongoIdempotencyStore()
+
+
+def get_idempotency_store():
+    """Get the configured idempotency store"""
+    if settings.IDEMPOTENCY_BACKEND == "mongo":
+        return mongo_store
+    return memory_store
+
+
+# Requests currently executing in this worker, so duplicates can wait on them
+_in_flight: dict[str, asyncio.Future] = {}
+
+
+def _replay(record: dict) -> Response:
+    return Response(
+        content=record["body"],
+        status_code=record["status_code"],
+        media_type=record["media_type"],
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+def _error(status_code: int, detail: str) -> JSONResponse:
+    return JSONResponse(status_code=status_code, content={"detail": detail})
+
+
+def _throttled(request: Request) -> Optional[JSONResponse]:
+    """Charge a replay to the route's rate limit, since it never reaches the route"""
+    limit = rate_limit_for_path(request.url.path)
+    retry_after = limit.retry_after(request) if limit else 0
+    if retry_after <= 0:
+        return None
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Too many requests"},
+        headers={"Retry-After": str(math.ceil(retry_after))},
+    )
+
+
+def _is_cacheable(status_code: int) -> bool:
+    # Throttled and failed requests never ran to completion; let the client retry them
+    return status_code < 500 and status_code != status.HTTP_429_TOO_MANY_REQUESTS
+
+
+async def idempotent_request(request: Request, call_next):
+    """Replay the stored response for a repeated Idempotency-Key instead of re-executing"""
+    key = request.headers.get(IDEMPOTENCY_HEADER)
+    if not key or request.method not in WRITE_METHODS or not request.url.path.startswith("/api/"):
+        return await call_next(request)
+
+    if len(key) > 255:
+        return _error(status.HTTP_400_BAD_REQUEST, "Idempotency-Key is too long")
+
+    body = await request.body()
+    fingerprint = hashlib.sha256(
+        request.method.encode() + b" " + request.url.path.encode() + b"\n" + body
+    ).hexdigest()
+    scoped_key = f"{client_key(request)}:{key}"
+    store = get_idempotency_store()
+    deadline = time.monotonic() + settings.IDEMPOTENCY_LOCK_SECONDS
+
+    while True:
+        record = store.get(scoped_key)
+        if record is not None and record["fingerprint"] != fingerprint:
+            return _error(
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                "Idempotency-Key was already used for a different request",
+            )
+        if record is not None and record["state"] == COMPLETED:
+            return _throttled(request) or _replay(record)
+
+        # A request still running here keeps the key even if its reservation expired
+        waiter = _in_flight.get(scoped_key)
+        if (
+            record is None
+            and waiter is None
+            and store.reserve(scoped_key, fingerprint, settings.IDEMPOTENCY_LOCK_SECONDS)
+        ):
+            break
+
+        # Someone else is executing this key: coalesce onto their result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return _error(status.HTTP_409_CONFLICT, "A request with this Idempotency-Key is in progress")
+        if waiter is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            # Executing in another worker; poll the shared store
+            await asyncio.sleep(min(0.1, remaining))
+
+    future = asyncio.get_running_loop().create_future()
+    _in_flight[scoped_key] = future
+    try:
+        response = await call_next(request)
+        content = b"".join([chunk async for chunk in response.body_iterator])
+
+        if _is_cacheable(response.status_code):
+            store.complete(
+                scoped_key,
+                {
+                    "fingerprint": fingerprint,
+                    "status_code": response.status_code,
+                    "media_type": response.headers.get("content-type"),
+                    "body": content,
+                },
+                settings.IDEMPOTENCY_TTL_HOURS * 3600,
+            )
+        else:
+            store.release(scoped_key)
+    except BaseException:
+        store.release(scoped_key)
+        raise
+    finally:
+        if _in_flight.get(scoped_key) is future:
+            del _in_flight[scoped_key]
+        future.set_result(None)
+
+    return Response(
+        content=content,
+        status_code=response.status_code,
+        headers=dict(response.headers),
+    )
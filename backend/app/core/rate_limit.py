@@ -0,0 +1,206 @@
+# backend/app/core/rate_limit.py
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import HTTPException, Request, status
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+from app.core.database import get_database
+from app.core.security import verify_token
+
+
+@dataclass(frozen=True)
+class BucketConfig:
+    capacity: float
+    refill_rate: float  # tokens per second
+
+    @property
+    def seconds_to_full(self) -> float:
+        return self.capacity / self.refill_rate
+
+
+def _refill(tokens: float, updated_at: float, now: float, config: BucketConfig) -> float:
+    elapsed = max(0.0, now - updated_at)
+    return min(config.capacity, tokens + elapsed * config.refill_rate)
+
+
+def _wait_for_token(tokens: float, config: BucketConfig) -> float:
+    return (1 - tokens) / config.refill_rate
+
+
+class MemoryRateLimitBackend:
+    """Token buckets kept in process memory (one set per worker)"""
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, config: BucketConfig, now: Optional[float] = None) -> float:
+        """Take one token. Returns 0 if allowed, otherwise seconds until a token is available"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (config.capacity, now))
+            tokens = _refill(tokens, updated_at, now, config)
+
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                self._buckets.move_to_end(key)
+                return _wait_for_token(tokens, config)
+
+            self._buckets[key] = (tokens - 1, now)
+            self._buckets.move_to_end(key)
+            # Least recently seen clients are forgotten first; they come back with a full bucket
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return 0.0
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class MongoRateLimitBackend:
+    """Token buckets in a shared MongoDB collection so every worker sees the same counts"""
+
+    collection_name = "rate_limits"
+
+    def __init__(self, max_retries: int = 5):
+        self.max_retries = max_retries
+
+    def consume(self, key: str, config: BucketConfig, now: Optional[float] = None) -> float:
+        """Take one token. Returns 0 if allowed, otherwise seconds until a token is available"""
+        now = time.time() if now is None else now
+        collection = get_database()[self.collection_name]
+        expires_at = datetime.fromtimestamp(now, timezone.utc) + timedelta(seconds=config.seconds_to_full)
+
+        for _ in range(self.max_retries):
+            doc = collection.find_one({"_id": key})
+            if doc is None:
+                try:
+                    collection.insert_one({
+                        "_id": key,
+                        "tokens": config.capacity - 1,
+                        "updated_at": now,
+                        "expires_at": expires_at,
+                    })
+                    return 0.0
+                except DuplicateKeyError:
+                    continue
+
+            tokens = _refill(doc["tokens"], doc["updated_at"], now, config)
+            if tokens < 1:
+                return _wait_for_token(tokens, config)
+
+            # Compare-and-set on the previous state; another worker may have taken a token meanwhile
+            result = collection.update_one(
+                {"_id": key, "tokens": doc["tokens"], "updated_at": doc["updated_at"]},
+                {"$set": {"tokens": tokens - 1, "updated_at": now, "expires_at": expires_at}},
+            )
+            if result.modified_count:
+                return 0.0
+
+        # Heavy contention on a single key means that client is the one hammering us
+        return 1 / config.refill_rate
+
+    def reset(self):
+        db = get_database()
+        if db is not None:
+            db[self.collection_name].delete_many({})
+
+
+memory_backend = MemoryRateLimitBackend()
+mongo_backend = MongoRateLimitBackend()
+
+
+def get_rate_limit_backend():
+    """Get the configured rate limit backend"""
+    if settings.RATE_LIMIT_BACKEND == "mongo":
+        return mongo_backend
+    return memory_backend
+
+
+def client_key(request: Request) -> str:
+    """Identify the caller by token subject when present, otherwise by client IP.
+
+    Only the JWT is decoded here so rejected requests never reach the users collection.
+    Behind a load balancer the client IP comes from X-Forwarded-For, which uvicorn
+    only honours for proxies listed in FORWARDED_ALLOW_IPS.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        payload = verify_token(token)
+        if payload and payload.get("sub"):
+            return f"user:{payload['sub']}"
+
+    host = request.client.host if request.client else "unknown"
+    return f"ip:{host}"
+
+
+class RateLimit:
+    """Route dependency enforcing a token bucket per caller within a named scope"""
+
+    def __init__(self, scope: str, burst: int, per_minute: int):
+        self.scope = scope
+        self.config = BucketConfig(capacity=burst, refill_rate=per_minute / 60)
+
+    def retry_after(self, request: Request) -> float:
+        """Take a token for this caller; returns 0 if allowed, otherwise seconds to wait"""
+        if not settings.RATE_LIMIT_ENABLED:
+            return 0.0
+        key = f"{self.scope}:{client_key(request)}"
+        return get_rate_limit_backend().consume(key, self.config)
+
+    async def __call__(self, request: Request):
+        retry_after = self.retry_after(request)
+        if retry_after > 0:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+
+auth_rate_limit = RateLimit(
+    "auth", settings.RATE_LIMIT_AUTH_BURST, settings.RATE_LIMIT_AUTH_PER_MINUTE
+)
+todos_rate_limit = RateLimit(
+    "todos", settings.RATE_LIMIT_TODOS_BURST, settings.RATE_LIMIT_TODOS_PER_MINUTE
+)
+
+# Router prefixes each limit is attached to in app.main, for middleware that
+# answers before routing (idempotent replays) and must charge the same bucket
+PATH_RATE_LIMITS = (("/api/auth/", auth_rate_limit), ("/api/todos/", todos_rate_limit))
+
+
+def rate_limit_for_path(path: str) -> Optional[RateLimit]:
+    for prefix, limit in PATH_RATE_LIMITS:
+        if path.startswith(prefix) or path == prefix.rstrip("/"):
+            return limit
+    return None
+
+
+class AdmissionControl:
+    """Server-wide cap on in-flight requests; a limit of 0 disables it"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+
+    def try_enter(self) -> bool:
+        if self.limit and self.in_flight >= self.limit:
+            return False
+        self.in_flight += 1
+        return True
+
+    def leave(self):
+        self.in_flight -= 1
+
+
+admission = AdmissionControl(settings.MAX_IN_FLIGHT_REQUESTS)
@@ -0,0 +1,306 @@
+# backend/app/core/reminders.py
+import asyncio
+import heapq
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Protocol
+
+from bson import ObjectId
+
+from app.core.config import settings
+from app.core.database import get_database
+from app.models.todo import ACTIVE_TODO_FILTER, Todo
+
+DUE_SOON = "due_soon"
+OVERDUE = "overdue"
+
+# Re-read this much of the change feed each poll, for writers whose clocks lag ours
+CHANGE_FEED_OVERLAP = timedelta(seconds=5)
+
+
+class ReminderSink(Protocol):
+    def emit(self, event: dict) -> None: ...
+
+
+class LogReminderSink:
+    """Default sink: write reminder events to stdout"""
+
+    def emit(self, event: dict) -> None:
+        print(f"Reminder {event['type']}: todo {event['todo_id']} (user {event['user_id']})")
+
+
+def _timestamp(deadline: datetime) -> float:
+    if deadline.tzinfo is None:
+        deadline = deadline.replace(tzinfo=timezone.utc)
+    return deadline.timestamp()
+
+
+class DeadlineScheduler:
+    """Fires "due soon" and "overdue" events from a min-heap of upcoming deadlines.
+
+    Only deadlines inside a rolling horizon are held in memory; the window is
+    topped up from the deadline index, so a restart simply reloads it. Writes
+    keep the heap current via schedule()/cancel() when they happen in this
+    process, and via the updated_at change feed when they happen in an HTTP
+    worker. Events are re-checked against the todo before they are emitted, so
+    deletes in other processes are honoured too. Superseded heap entries are
+    skipped when popped rather than removed in place.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[ReminderSink] = None,
+        due_soon: timedelta = timedelta(minutes=60),
+        horizon: timedelta = timedelta(hours=24),
+        max_pending: int = 100000,
+        poll_interval: float = 10.0,
+    ):
+        self.sink = sink or LogReminderSink()
+        self.due_soon = due_soon.total_seconds()
+        self.horizon = horizon.total_seconds()
+        self.max_pending = max_pending
+        self.poll_interval = poll_interval
+
+        self._heap: list[tuple[float, str, str, int]] = []
+        self._tracked: dict[str, tuple[str, float, int]] = {}  # todo_id -> (user_id, deadline, version)
+        self._version = 0
+        self._window_end = 0.0
+        self._next_refill = 0.0
+        self._changes_since: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._tracked)
+
+    def _push(self, fire_at: float, kind: str, todo_id: str, version: int):
+        heapq.heappush(self._heap, (fire_at, kind, todo_id, version))
+        if self._wakeup is not None and self._heap[0][0] == fire_at:
+            self._wakeup.set()
+
+    def _track(self, todo_id: str, user_id: str, deadline: float, now: float, from_write: bool):
+        self._version += 1
+        self._tracked[todo_id] = (user_id, deadline, self._version)
+        due_soon_at = deadline - self.due_soon
+
+        if due_soon_at >= now:
+            self._push(due_soon_at, DUE_SOON, todo_id, self._version)
+        elif from_write:
+            # Deadline was just set inside the reminder window: warn right away
+            self._push(now, DUE_SOON, todo_id, self._version)
+
+        self._push(deadline, OVERDUE, todo_id, self._version)
+
+    def schedule(self, todo_doc: dict, now: Optional[float] = None):
+        """Track (or re-track) a todo after it was created or updated"""
+        now = time.time() if now is None else now
+        todo_id = str(todo_doc["_id"])
+        previous = self._tracked.pop(todo_id, None)
+
+        deadline = todo_doc.get("deadline")
+        if deadline is None or Todo.status(todo_doc) == "finished":
+            return
+
+        deadline = _timestamp(deadline)
+        if previous and previous[1] == deadline:
+            # Unrelated edit; keep the reminders already queued
+            self._tracked[todo_id] = previous
+            return
+        if deadline < now or deadline >= self._window_end:
+            # Already overdue, or beyond the loaded window (a later refill picks it up)
+            return
+        if len(self._tracked) >= self.max_pending:
+            # Full: give this part of the window back to refill, which loads it as room frees up
+            self._window_end = deadline
+            return
+        self._track(todo_id, todo_doc["user_id"], deadline, now, from_write=True)
+        self._compact()
+
+    def cancel(self, todo_id: str):
+        """Stop tracking a deleted todo"""
+        self._tracked.pop(todo_id, None)
+        self._compact()
+
+    def refill(self, now: Optional[float] = None):
+        """Load deadlines that entered the horizon since the last refill"""
+        now = time.time() if now is None else now
+        start = max(self._window_end, now)
+        end = now + self.horizon
+        if end <= start:
+            return
+
+        room = self.max_pending - len(self._tracked)
+        if room <= 0:
+            return
+
+        db = get_database()
+        cursor = (
+            db.todos.find(
+                {
+                    "deadline": {
+                        "$gte": datetime.fromtimestamp(start, timezone.utc),
+                        "$lt": datetime.fromtimestamp(end, timezone.utc),
+                    },
+                    **ACTIVE_TODO_FILTER,
+                },
+                {"user_id": 1, "deadline": 1},
+            )
+            .sort("deadline", 1)
+            .limit(room)
+        )
+
+        loaded = 0
+        last_deadline = start
+        for doc in cursor:
+            last_deadline = _timestamp(doc["deadline"])
+            self._track(str(doc["_id"]), doc["user_id"], last_deadline, now, from_write=False)
+            loaded += 1
+
+        # When capped, only claim the part of the window actually loaded
+        self._window_end = last_deadline if loaded == room else end
+        self._compact()
+
+    def rebuild(self, now: Optional[float] = None):
+        """Drop in-memory state and reload the current horizon"""
+        now = time.time() if now is None else now
+        self._heap.clear()
+        self._tracked.clear()
+        self._window_end = 0.0
+        self._changes_since = datetime.fromtimestamp(now, timezone.utc)
+        self.refill(now)
+
+    def poll_changes(self, now: Optional[float] = None):
+        """Re-schedule todos written since the last poll, by any process"""
+        now = time.time() if now is None else now
+        cursor = get_database().todos.find(
+            {"updated_at": {"$gte": self._changes_since - CHANGE_FEED_OVERLAP}},
+            {"user_id": 1, "deadline": 1, "status": 1, "completed": 1},
+        )
+        for doc in cursor:
+            self.schedule(doc, now)
+        # Only advance once the whole batch was read, so a failed poll is retried
+        self._changes_since = datetime.fromtimestamp(now, timezone.utc)
+
+    def confirm(self, events: list[dict]) -> list[dict]:
+        """Drop events for todos that were deleted, finished or rescheduled elsewhere"""
+        if not events:
+            return events
+        current = {
+            str(doc["_id"]): doc
+            for doc in get_database().todos.find(
+                {"_id": {"$in": [ObjectId(e["todo_id"]) for e in events]}},
+                {"deadline": 1, "status": 1, "completed": 1},
+            )
+        }
+        confirmed = []
+        for event in events:
+            doc = current.get(event["todo_id"])
+            if doc is None or Todo.status(doc) == "finished" or not doc.get("deadline"):
+                continue
+            # MongoDB keeps milliseconds, so a freshly written deadline may differ by less
+            if abs(_timestamp(doc["deadline"]) - event["deadline"].timestamp()) >= 0.001:
+                continue
+            confirmed.append(event)
+        return confirmed
+
+    def _compact(self):
+        if len(self._heap) > 2 * (2 * len(self._tracked) + 64):
+            self._heap = [
+                entry for entry in self._heap
+                if self._tracked.get(entry[2], (None, None, None))[2] == entry[3]
+            ]
+            heapq.heapify(self._heap)
+
+    def pop_due(self, now: Optional[float] = None) -> list[dict]:
+        """Pop every event whose fire time has passed"""
+        now = time.time() if now is None else now
+        events = []
+        while self._heap and self._heap[0][0] <= now:
+            _, kind, todo_id, version = heapq.heappop(self._heap)
+            current = self._tracked.get(todo_id)
+            if current is None or current[2] != version:
+                continue
+            if kind == OVERDUE:
+                del self._tracked[todo_id]
+            events.append({
+                "type": kind,
+                "todo_id": todo_id,
+                "user_id": current[0],
+                "deadline": datetime.fromtimestamp(current[1], timezone.utc),
+            })
+        return events
+
+    def _seconds_until_next(self, now: float) -> float:
+        wait = max(0.0, self._next_refill - now)
+        if self._heap:
+            wait = min(wait, max(0.0, self._heap[0][0] - now))
+        return wait
+
+    def _requeue(self, events: list[dict], now: float):
+        """Track popped events again so the next pass retries them"""
+        due_soon = {event["todo_id"] for event in events if event["type"] == DUE_SOON}
+        for event in events:
+            self._track(
+                event["todo_id"], event["user_id"], event["deadline"].timestamp(), now,
+                from_write=event["todo_id"] in due_soon,
+            )
+
+    def _tick(self, now: float):
+        if now >= self._next_refill:
+            self.poll_changes(now)
+            self.refill(now)
+            self._next_refill = now + self.poll_interval
+
+        events = self.pop_due(now)
+        try:
+            events = self.confirm(events)
+        except Exception:
+            self._requeue(events, now)
+            raise
+
+        for event in events:
+            try:
+                self.sink.emit(event)
+            except Exception as e:
+                print(f"Reminder sink failed: {e}")
+
+    async def _run(self):
+        while True:
+            now = time.time()
+            try:
+                self._tick(now)
+            except Exception as e:
+                # Usually a database blip: back off, then retry from the same state
+                print(f"Reminder scheduler failed: {e}")
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._seconds_until_next(now))
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        """Rebuild from the database and start the background loop"""
+        self._wakeup = asyncio.Event()
+        self.rebuild()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._window_end = 0.0  # schedule() becomes a no-op until the next start
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+deadline_scheduler = DeadlineScheduler(
+    due_soon=timedelta(minutes=settings.REMINDER_DUE_SOON_MINUTES),
+    horizon=timedelta(hours=settings.REMINDER_HORIZON_HOURS),
+    max_pending=settings.REMINDER_MAX_PENDING,
+)
@@ -0,0 +1,51 @@
+# backend/app/jobs.py
+"""Background jobs: deadline reminders and counter reconciliation.
+
+They must run in exactly one process per deployment. A single `uvicorn
+app.main:app` runs them in its lifespan. `python -m app.serve` turns them off
+in its HTTP workers and starts this module as one separate process instead;
+run `python -m app.jobs` yourself when JOBS_PROCESS is off.
+"""
+import asyncio
+import signal
+from contextlib import asynccontextmanager
+
+from app.core.config import settings
+from app.core.counters import run_reconciliation
+from app.core.database import connect_to_mongo, close_mongo_connection
+from app.core.reminders import deadline_scheduler
+
+
+@asynccontextmanager
+async def background_jobs():
+    """Run the reminder scheduler and counter reconciliation while the block is open"""
+    if settings.REMINDERS_ENABLED:
+        deadline_scheduler.start()
+    reconciler = asyncio.create_task(run_reconciliation(settings.COUNTER_RECONCILE_MINUTES * 60))
+    try:
+        yield
+    finally:
+        reconciler.cancel()
+        await deadline_scheduler.stop()
+
+
+async def run():
+    connect_to_mongo()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        async with background_jobs():
+            await stop.wait()
+    finally:
+        close_mongo_connection()
+
+
+def main():
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,25 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 from app.core.database import connect_to_mongo, close_mongo_connection
 from app.api.routes import auth, todos
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware
+from app.core.idempotency import idempotent_request
+from app.core.rate_limit import admission, auth_rate_limit, todos_rate_limit
+from app.jobs import background_jobs
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
     # Startup
     connect_to_mongo()
-    yield
+    if settings.BACKGROUND_JOBS:
+        async with background_jobs():
+            yield
+    else:
+        yield
     # Shutdown
     close_mongo_connection()
 
@@ -22,6 +31,26 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Idempotency-Key replay for write routes (runs inside admission control)
+app.middleware("http")(idempotent_request)
+
+# Admission control (registered before CORS so shed responses still carry CORS headers)
+@app.middleware("http")
+async def admission_control(request: Request, call_next):
+    if not admission.try_enter():
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Server is busy, try again shortly"},
+            headers={"Retry-After": "1"},
+        )
+    try:
+        return await call_next(request)
+    finally:
+        admission.leave()
+
+# Compress large responses (outside idempotency so stored replays stay uncompressed)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -38,8 +67,18 @@ app.add_middleware(
 )
 
 # Include routers
-app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(todos.router, prefix="/api/todos", tags=["Todos"])
+app.include_router(
+    auth.router,
+    prefix="/api/auth",
+    tags=["Authentication"],
+    dependencies=[Depends(auth_rate_limit)],
+)
+app.include_router(
+    todos.router,
+    prefix="/api/todos",
+    tags=["Todos"],
+    dependencies=[Depends(todos_rate_limit)],
+)
 
 # Root endpoint
 @app.get("/")
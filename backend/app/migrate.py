@@ -0,0 +1,40 @@
+# backend/app/migrate.py
+"""One-off schema migrations: python -m app.migrate
+
+Startup only ever creates indexes. Dropping the ones a newer index replaced is
+left to this command, so run it once after deploying, from a single machine.
+"""
+from pymongo.errors import OperationFailure
+
+from app.core.database import connect_to_mongo, close_mongo_connection, get_database
+
+# Board indexes replaced by (user_id, priority, status, deadline, _id)
+SUPERSEDED_INDEXES = {
+    "todos": ["user_id_1_priority_1_deadline_1", "user_id_1_priority_1_deadline_1__id_1"],
+}
+
+
+def drop_superseded_indexes(db) -> list[str]:
+    """Drop indexes no query needs any more; returns the ones that were dropped"""
+    dropped = []
+    for collection, names in SUPERSEDED_INDEXES.items():
+        for name in names:
+            try:
+                db[collection].drop_index(name)
+            except OperationFailure:
+                continue  # already gone
+            dropped.append(f"{collection}.{name}")
+    return dropped
+
+
+def main():
+    connect_to_mongo()
+    try:
+        dropped = drop_superseded_indexes(get_database())
+        print(f"Dropped indexes: {', '.join(dropped)}" if dropped else "Nothing to migrate")
+    finally:
+        close_mongo_connection()
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,18 @@ def format_time_left(seconds: int) -> str:
     return f"{text} overdue" if overdue else f"{text} left"
 
 
+# Query matching todos that status() reports as not finished
+ACTIVE_TODO_FILTER = {"$nor": [{"status": "finished"}, {"status": None, "completed": True}]}
+
+
 class Todo:
+    @staticmethod
+    def status(todo_doc: dict) -> str:
+        """Workflow status, falling back to the legacy `completed` flag"""
+        if todo_doc.get("status"):
+            return todo_doc["status"]
+        return "finished" if todo_doc.get("completed") else "not_started"
+
     @staticmethod
     def create(
         title: str,
@@ -47,8 +58,8 @@ class Todo:
         todo["id"] = str(todo["_id"])
         del todo["_id"]
 
-        if "status" not in todo:
-            todo["status"] = "finished" if todo.get("completed") else "not_started"
+        if not todo.get("status"):
+            todo["status"] = Todo.status(todo)
         if "priority" not in todo:
             todo["priority"] = "medium"
         if "description" not in todo:
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict, field_validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime, date, time, timezone
 from enum import Enum
 
@@ -73,3 +73,32 @@ class TodoResponse(TodoBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TodoBoardGroup(BaseModel):
+    priority: TodoPriority
+    todos: List[TodoResponse]
+    next_cursor: Optional[str] = None
+
+
+class TodoBoard(BaseModel):
+    groups: List[TodoBoardGroup]
+
+
+class TodoStats(BaseModel):
+    total: int
+    open: int
+    overdue: int
+    status: dict[TodoStatus, int]
+    priority: dict[TodoPriority, int]
+
+
+class TodoCompactResponse(TodoBase):
+    """List item without fields the client can derive (owner, overdue flag, countdown text)"""
+    id: str
+    status: TodoStatus
+    priority: TodoPriority
+    deadline: Optional[datetime] = None
+    time_left_seconds: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
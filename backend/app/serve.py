@@ -0,0 +1,73 @@
+# backend/app/serve.py
+"""Production entry point: python -m app.serve
+
+Runs app.main:app under uvicorn's process manager. Every worker imports the app
+itself and opens its own MongoDB client in the lifespan, so connection pools are
+never shared between processes. Background jobs run in one extra process, never
+in the HTTP workers.
+"""
+import multiprocessing
+import os
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from app.core.config import settings
+from app import jobs
+
+
+def worker_count() -> int:
+    if settings.WORKERS:
+        return settings.WORKERS
+    try:
+        # CPUs this process may actually use (container cpusets), not the host's count
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS
+        return os.cpu_count() or 1
+
+
+def main():
+    # Keep the reminder scheduler and reconciler out of the HTTP workers, both in
+    # the environment they are spawned with and in this process's settings
+    os.environ["BACKGROUND_JOBS"] = "false"
+    settings.BACKGROUND_JOBS = False
+
+    jobs_process = None
+    if settings.JOBS_PROCESS:
+        jobs_process = multiprocessing.get_context("spawn").Process(
+            target=jobs.main, name="background-jobs"
+        )
+        jobs_process.start()
+
+    try:
+        _run_workers()
+    finally:
+        if jobs_process is not None:
+            jobs_process.terminate()  # SIGTERM: the jobs loop shuts down cleanly
+            jobs_process.join(settings.GRACEFUL_SHUTDOWN_SECONDS)
+
+
+def _run_workers():
+    config = uvicorn.Config(
+        "app.main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=worker_count(),
+        loop=settings.LOOP,
+        http=settings.HTTP,
+        backlog=settings.BACKLOG,
+        timeout_keep_alive=settings.KEEPALIVE_SECONDS,
+        timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_SECONDS,
+        # A recycled worker exits after finishing its requests and the manager starts a fresh one
+        limit_max_requests=settings.MAX_REQUESTS_PER_WORKER or None,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.FORWARDED_ALLOW_IPS,
+    )
+    # Supervise even a single worker (uvicorn.run would serve it in this process):
+    # it then starts from the environment above, and is restarted after recycling
+    sock = config.bind_socket()
+    Multiprocess(config, target=uvicorn.Server(config).run, sockets=[sock]).run()
+
+
+if __name__ == "__main__":
+    main()
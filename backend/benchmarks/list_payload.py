@@ -0,0 +1,62 @@
+"""Bytes on the wire for GET /api/todos/ at 1k and 10k todos.
+
+Run from backend/:  python -m benchmarks.list_payload
+"""
+import gzip
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+
+from app.core.compression import brotli
+from app.models.todo import Todo
+from app.schemas.todo import TodoCompactResponse, TodoResponse
+
+PRIORITIES = ["low", "medium", "high", "urgent"]
+STATUSES = ["not_started", "in_progress", "finished"]
+
+
+def make_todos(count: int) -> list[dict]:
+    rng = random.Random(count)
+    user_id = str(ObjectId())
+    now = datetime.now(timezone.utc)
+    todos = []
+    for i in range(count):
+        doc = Todo.create(
+            title=f"Task {i}",
+            description="Some notes about this task. " * rng.randint(0, 4),
+            user_id=user_id,
+            deadline=now + timedelta(hours=rng.randint(-48, 24 * 30)) if rng.random() < 0.7 else None,
+            priority=rng.choice(PRIORITIES),
+        )
+        doc["status"] = rng.choice(STATUSES)
+        doc["_id"] = ObjectId()
+        todos.append(Todo.to_dict(doc))
+    return todos
+
+
+def encode(items) -> bytes:
+    # Same separators as starlette's JSONResponse
+    return json.dumps(jsonable_encoder(items), separators=(",", ":")).encode()
+
+
+def sizes(body: bytes) -> list[str]:
+    row = [f"{len(body):>10,}", f"{len(gzip.compress(body, compresslevel=6)):>10,}"]
+    row.append(f"{len(brotli.compress(body, quality=4)):>10,}" if brotli else f"{'n/a':>10}")
+    return row
+
+
+def main():
+    print(f"{'todos':>6} {'mode':>8} {'identity':>10} {'gzip-6':>10} {'br-4':>10}")
+    for count in (1000, 10000):
+        todos = make_todos(count)
+        full = [TodoResponse.model_validate(t) for t in todos]
+        compact = [TodoCompactResponse.model_validate(t) for t in todos]
+        for mode, items in (("full", full), ("compact", compact)):
+            print(f"{count:>6} {mode:>8} " + " ".join(sizes(encode(items))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Requests per second against a running server.
+
+Compare the single-process default with the production entry point:
+
+    uvicorn app.main:app --port 5000          # then: python -m benchmarks.throughput
+    python -m app.serve                        # then: python -m benchmarks.throughput
+
+Pass --token to hit authenticated routes, e.g. --path /api/todos/ --token <jwt>.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def worker(client: httpx.AsyncClient, path: str, stop_at: float, latencies: list, errors: list):
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        try:
+            res = await client.get(path)
+            if res.status_code >= 400:
+                errors.append(res.status_code)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(args):
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    latencies, errors = [], []
+
+    async with httpx.AsyncClient(base_url=args.url, headers=headers, limits=limits) as client:
+        await client.get(args.path)  # warm up
+        stop_at = time.perf_counter() + args.seconds
+        await asyncio.gather(*[
+            worker(client, args.path, stop_at, latencies, errors)
+            for _ in range(args.concurrency)
+        ])
+
+    latencies.sort()
+    print(f"{len(latencies) / args.seconds:,.0f} req/s over {args.seconds}s, concurrency {args.concurrency}")
+    print(f"p50 {statistics.median(latencies) * 1000:.1f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms, errors {len(errors)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("--path", default="/health")
+    parser.add_argument("--token")
+    parser.add_argument("--seconds", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=64)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
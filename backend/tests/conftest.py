@@ -13,6 +13,10 @@ import app.main as main_module
 import app.api.routes.auth as auth_routes
 import app.api.routes.todos as todos_routes
 import app.api.deps as deps_module
+import app.core.counters as counters_module
+import app.core.idempotency as idempotency_module
+import app.core.rate_limit as rate_limit_module
+import app.core.reminders as reminders_module
 
 
 @pytest.fixture()
@@ -32,6 +36,21 @@ def client(db, monkeypatch):
     monkeypatch.setattr(auth_routes, "get_database", lambda: db)
     monkeypatch.setattr(todos_routes, "get_database", lambda: db)
     monkeypatch.setattr(deps_module, "get_database", lambda: db)
+    monkeypatch.setattr(rate_limit_module, "get_database", lambda: db)
+    monkeypatch.setattr(reminders_module, "get_database", lambda: db)
+    monkeypatch.setattr(idempotency_module, "get_database", lambda: db)
+    monkeypatch.setattr(counters_module, "get_database", lambda: db)
+    rate_limit_module.memory_backend.reset()
+    idempotency_module.memory_store.reset()
 
     with TestClient(main_module.app) as c:
         yield c
+
+
+@pytest.fixture()
+def auth_headers(client):
+    res = client.post(
+        "/api/auth/register",
+        json={"email": "test@example.com", "password": "TestPass123", "name": "Test User"},
+    )
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
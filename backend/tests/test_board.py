@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+
+
+def create(client, headers, title, priority="medium", deadline=None):
+    payload = {"title": title, "priority": priority}
+    if deadline:
+        payload["deadline"] = deadline
+    return client.post("/api/todos/", json=payload, headers=headers).json()
+
+
+def titles(group):
+    return [todo["title"] for todo in group["todos"]]
+
+
+def test_board_groups_by_priority_and_orders_by_deadline(client, auth_headers):
+    create(client, auth_headers, "no deadline")
+    create(client, auth_headers, "later", deadline="2026-12-31")
+    create(client, auth_headers, "sooner", deadline="2026-11-01")
+    create(client, auth_headers, "urgent one", priority="urgent")
+    done = create(client, auth_headers, "done", deadline="2026-10-01")
+    client.patch(f"/api/todos/{done['id']}", json={"status": "finished"}, headers=auth_headers)
+
+    res = client.get("/api/todos/board", headers=auth_headers)
+    assert res.status_code == 200, res.text
+    groups = res.json()["groups"]
+
+    assert [g["priority"] for g in groups] == ["urgent", "high", "medium", "low"]
+    assert titles(groups[0]) == ["urgent one"]
+    assert titles(groups[1]) == []
+    assert titles(groups[2]) == ["sooner", "later", "no deadline"]
+    assert all(g["next_cursor"] is None for g in groups)
+
+
+def test_board_group_pagination_spans_dated_and_undated_todos(client, auth_headers):
+    for day in (3, 1, 2):
+        create(client, auth_headers, f"day {day}", priority="high", deadline=f"2026-11-0{day}")
+    create(client, auth_headers, "day 2 again", priority="high", deadline="2026-11-02")
+    for i in range(2):
+        create(client, auth_headers, f"undated {i}", priority="high")
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"priority": "high", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        res = client.get("/api/todos/board", params=params, headers=auth_headers)
+        assert res.status_code == 200, res.text
+        (group,) = res.json()["groups"]
+        seen += titles(group)
+        cursor = group["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == ["day 1", "day 2", "day 2 again", "day 3", "undated 0", "undated 1"]
+
+
+def test_board_rejects_bad_cursor(client, auth_headers):
+    res = client.get("/api/todos/board", params={"priority": "low", "cursor": "nope"}, headers=auth_headers)
+    assert res.status_code == 400
+
+    res = client.get("/api/todos/board", params={"cursor": "abc"}, headers=auth_headers)
+    assert res.status_code == 400
+
+
+def test_board_applies_legacy_priority_and_completed_rules(client, db, auth_headers):
+    create(client, auth_headers, "modern medium", deadline="2026-11-02")
+    user_id = str(db.users.find_one({"email": "test@example.com"})["_id"])
+    now = datetime.now(timezone.utc)
+    legacy = {"user_id": user_id, "created_at": now, "updated_at": now}
+    db.todos.insert_many([
+        {**legacy, "title": "legacy no priority", "deadline": None},
+        {**legacy, "title": "legacy open", "priority": "high", "completed": False},
+        {**legacy, "title": "legacy done", "priority": "high", "completed": True},
+        {**legacy, "title": "legacy done medium", "completed": True},
+    ])
+
+    groups = {g["priority"]: g for g in client.get("/api/todos/board", headers=auth_headers).json()["groups"]}
+
+    assert titles(groups["medium"]) == ["modern medium", "legacy no priority"]
+    assert groups["medium"]["todos"][1]["priority"] == "medium"
+    assert titles(groups["high"]) == ["legacy open"]
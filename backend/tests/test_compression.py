@@ -0,0 +1,52 @@
+import pytest
+
+from app.core.compression import accepted_encodings, brotli
+
+
+def create_todos(client, headers, count):
+    for i in range(count):
+        client.post(
+            "/api/todos/",
+            json={"title": f"Task {i}", "deadline": "2026-12-31"},
+            headers=headers,
+        )
+
+
+def test_accepted_encodings_respects_q_zero():
+    assert accepted_encodings("gzip, br;q=0") == {"gzip"}
+    assert accepted_encodings("BR;q=0.5, identity") == {"br", "identity"}
+    assert accepted_encodings("") == set()
+
+
+def test_compact_list_omits_derivable_fields(client, auth_headers):
+    create_todos(client, auth_headers, 1)
+
+    full = client.get("/api/todos/", headers=auth_headers).json()[0]
+    compact = client.get("/api/todos/?compact=true", headers=auth_headers).json()[0]
+
+    for field in ("user_id", "time_left_human", "is_overdue"):
+        assert field in full
+        assert field not in compact
+    assert compact["id"] == full["id"]
+    assert compact["deadline"] == full["deadline"]
+
+
+def test_large_list_is_gzipped_small_response_is_not(client, auth_headers):
+    create_todos(client, auth_headers, 10)
+
+    res = client.get("/api/todos/", headers={**auth_headers, "Accept-Encoding": "gzip"})
+    assert res.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in res.headers["vary"]
+    assert len(res.json()) == 10
+
+    res = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in res.headers
+
+
+@pytest.mark.skipif(brotli is None, reason="brotli not installed")
+def test_brotli_preferred_when_accepted(client, auth_headers):
+    create_todos(client, auth_headers, 10)
+
+    res = client.get("/api/todos/", headers={**auth_headers, "Accept-Encoding": "gzip, br"})
+    assert res.headers["content-encoding"] == "br"
+    assert len(res.json()) == 10
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+
+import asyncio
+
+import app.core.counters as counters_module
+from app.core.counters import get_counters, reconcile_counters, run_reconciliation
+
+
+def create(client, headers, **fields):
+    return client.post("/api/todos/", json={"title": "T", **fields}, headers=headers).json()
+
+
+def test_stats_follow_create_update_delete(client, auth_headers):
+    past = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
+
+    a = create(client, auth_headers, priority="high", deadline=past)
+    b = create(client, auth_headers, priority="low")
+    create(client, auth_headers, priority="low")
+
+    client.patch(f"/api/todos/{b['id']}", json={"status": "in_progress", "priority": "urgent"}, headers=auth_headers)
+    client.patch(f"/api/todos/{a['id']}", json={"title": "Renamed"}, headers=auth_headers)
+
+    stats = client.get("/api/todos/stats", headers=auth_headers).json()
+    assert stats["total"] == 3
+    assert stats["open"] == 3
+    assert stats["overdue"] == 1
+    assert stats["status"] == {"not_started": 2, "in_progress": 1, "finished": 0}
+    assert stats["priority"] == {"low": 1, "medium": 0, "high": 1, "urgent": 1}
+
+    client.patch(f"/api/todos/{a['id']}", json={"status": "finished"}, headers=auth_headers)
+    client.delete(f"/api/todos/{b['id']}", headers=auth_headers)
+
+    stats = client.get("/api/todos/stats", headers=auth_headers).json()
+    assert stats["total"] == 2
+    assert stats["open"] == 1
+    assert stats["overdue"] == 0
+    assert stats["status"]["finished"] == 1
+    assert stats["priority"] == {"low": 1, "medium": 0, "high": 0, "urgent": 0}
+
+
+def test_overdue_resolves_current_hour_bucket(db):
+    now = datetime(2026, 6, 1, 12, 30, tzinfo=timezone.utc)
+    for minutes in (-90, -10, 10):
+        db.todos.insert_one({
+            "_id": ObjectId(),
+            "user_id": "u1",
+            "status": "not_started",
+            "priority": "medium",
+            "deadline": now + timedelta(minutes=minutes),
+        })
+    # Legacy finished todo in the current hour must not count as overdue
+    db.todos.insert_one({
+        "_id": ObjectId(),
+        "user_id": "u1",
+        "completed": True,
+        "deadline": now - timedelta(minutes=5),
+    })
+
+    # No counters document yet: the first read builds it
+    assert get_counters(db, "u1", now=now)["overdue"] == 2
+    assert get_counters(db, "u1", now=now + timedelta(minutes=20))["overdue"] == 3
+
+
+def test_reconcile_repairs_drift(client, db, auth_headers):
+    create(client, auth_headers)
+    create(client, auth_headers)
+    assert reconcile_counters(db) == 0
+
+    user_id = db.users.find_one()["_id"]
+    db.todo_counters.update_one({"_id": str(user_id)}, {"$inc": {"total": 5, "priority.high": 1}})
+    assert reconcile_counters(db) == 1
+
+    stats = client.get("/api/todos/stats", headers=auth_headers).json()
+    assert stats["total"] == 2
+    assert stats["priority"]["high"] == 0
+
+
+def test_first_write_for_existing_user_seeds_full_counts(client, db, auth_headers):
+    user_id = str(db.users.find_one()["_id"])
+    # Todos written before counters existed
+    for _ in range(3):
+        db.todos.insert_one({"user_id": user_id, "title": "old", "status": "not_started", "priority": "high"})
+
+    create(client, auth_headers, priority="low")
+
+    stats = client.get("/api/todos/stats", headers=auth_headers).json()
+    assert stats["total"] == 4
+    assert stats["priority"] == {"low": 1, "medium": 0, "high": 3, "urgent": 0}
+
+
+def test_reconciliation_runs_once_at_startup_when_interval_is_zero(db, monkeypatch):
+    monkeypatch.setattr(counters_module, "get_database", lambda: db)
+    db.todos.insert_one({"user_id": "u1", "status": "in_progress", "priority": "low"})
+    db.todo_counters.insert_one({"_id": "u1", "total": 7})
+
+    asyncio.run(run_reconciliation(0))
+
+    assert db.todo_counters.find_one({"_id": "u1"})["total"] == 1
+
+
+def test_fields_that_reach_zero_are_removed(client, db, auth_headers):
+    todo = create(client, auth_headers, priority="high", deadline="2026-11-01T10:00:00Z")
+    client.patch(f"/api/todos/{todo['id']}", json={"status": "finished"}, headers=auth_headers)
+
+    doc = db.todo_counters.find_one()
+    assert doc.get("deadline_buckets", {}) == {}
+    assert doc["status"] == {"finished": 1}
+    assert "open" not in doc
+
+
+def test_reconcile_clears_leftover_zero_fields(db):
+    db.todos.insert_one({"user_id": "u1", "status": "finished", "priority": "low"})
+    db.todo_counters.insert_one({
+        "_id": "u1",
+        "total": 1,
+        "open": 0,
+        "status": {"finished": 1, "not_started": 0},
+        "deadline_buckets": {"493000": 0},
+    })
+
+    assert reconcile_counters(db) == 1
+    assert db.todo_counters.find_one({"_id": "u1"}) == {"_id": "u1", "total": 1, "status": {"finished": 1}}
@@ -0,0 +1,116 @@
+import asyncio
+
+import httpx
+
+import app.core.rate_limit as rate_limit_module
+import app.main as main_module
+from app.core.rate_limit import BucketConfig
+
+
+def register(client, headers=None):
+    return client.post(
+        "/api/auth/register",
+        json={"email": "idem@example.com", "password": "TestPass123", "name": "Idem"},
+        headers=headers,
+    )
+
+
+def keyed(headers, key):
+    return {**headers, "Idempotency-Key": key}
+
+
+def test_retried_create_returns_cached_todo(client, db, auth_headers):
+    first = client.post("/api/todos/", json={"title": "Once"}, headers=keyed(auth_headers, "k1"))
+    retry = client.post("/api/todos/", json={"title": "Once"}, headers=keyed(auth_headers, "k1"))
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json()["id"] == first.json()["id"]
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert db.todos.count_documents({}) == 1
+
+
+def test_replays_are_rate_limited(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(rate_limit_module.todos_rate_limit, "config", BucketConfig(capacity=3, refill_rate=0.001))
+    headers = keyed(auth_headers, "k-limited")
+
+    statuses = [client.post("/api/todos/", json={"title": "Once"}, headers=headers).status_code for _ in range(4)]
+
+    # One execution and two replays use up the burst; the next replay is throttled
+    assert statuses == [201, 201, 201, 429]
+
+
+def test_reusing_key_for_different_request_is_rejected(client, auth_headers):
+    client.post("/api/todos/", json={"title": "A"}, headers=keyed(auth_headers, "k2"))
+    res = client.post("/api/todos/", json={"title": "B"}, headers=keyed(auth_headers, "k2"))
+    assert res.status_code == 422
+
+
+def test_retried_register_replays_instead_of_conflicting(client, db):
+    first = register(client, headers={"Idempotency-Key": "signup-1"})
+    retry = register(client, headers={"Idempotency-Key": "signup-1"})
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert db.users.count_documents({}) == 1
+
+
+def test_requests_without_key_are_not_deduplicated(client, db, auth_headers):
+    client.post("/api/todos/", json={"title": "Twice"}, headers=auth_headers)
+    client.post("/api/todos/", json={"title": "Twice"}, headers=auth_headers)
+    assert db.todos.count_documents({}) == 2
+
+
+def test_concurrent_duplicates_coalesce(client, db, auth_headers):
+    async def send_twice():
+        transport = httpx.ASGITransport(app=main_module.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            return await asyncio.gather(*[
+                ac.post("/api/todos/", json={"title": "Race"}, headers=keyed(auth_headers, "k3"))
+                for _ in range(2)
+            ])
+
+    first, second = asyncio.run(send_twice())
+    assert first.status_code == second.status_code == 201
+    assert first.json()["id"] == second.json()["id"]
+    assert db.todos.count_documents({}) == 1
+
+
+def test_mongo_store_shares_responses(client, db, monkeypatch, auth_headers):
+    monkeypatch.setattr(main_module.settings, "IDEMPOTENCY_BACKEND", "mongo")
+
+    first = client.post("/api/todos/", json={"title": "Shared"}, headers=keyed(auth_headers, "k4"))
+    retry = client.post("/api/todos/", json={"title": "Shared"}, headers=keyed(auth_headers, "k4"))
+
+    assert retry.json()["id"] == first.json()["id"]
+    assert db.idempotency_keys.count_documents({"state": "completed"}) == 1
+    assert db.todos.count_documents({}) == 1
+
+
+def test_memory_store_never_evicts_pending_reservations():
+    from app.core.idempotency import MemoryIdempotencyStore
+
+    store = MemoryIdempotencyStore(max_keys=2)
+    store.reserve("running", "f", ttl=30)
+    store.reserve("done", "f", ttl=30)
+    store.complete("done", {"fingerprint": "f"}, ttl=30)
+    store.reserve("new", "f", ttl=30)
+
+    assert store.get("running")["state"] == "pending"
+    assert store.get("done") is None
+
+
+def test_expired_reservation_does_not_let_a_duplicate_run(client, db, monkeypatch, auth_headers):
+    # Reservations expire immediately, as if the first request outlived IDEMPOTENCY_LOCK_SECONDS
+    monkeypatch.setattr(main_module.settings, "IDEMPOTENCY_LOCK_SECONDS", 0)
+
+    async def send_twice():
+        transport = httpx.ASGITransport(app=main_module.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            return await asyncio.gather(*[
+                ac.post("/api/todos/", json={"title": "Slow"}, headers=keyed(auth_headers, "k5"))
+                for _ in range(2)
+            ])
+
+    responses = asyncio.run(send_twice())
+    assert sorted(r.status_code for r in responses) in ([201, 201], [201, 409])
+    assert db.todos.count_documents({}) == 1
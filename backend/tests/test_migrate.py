@@ -0,0 +1,13 @@
+from app.migrate import drop_superseded_indexes
+
+
+def test_drops_superseded_board_indexes_once(db):
+    db.todos.create_index([("user_id", 1), ("priority", 1), ("deadline", 1)])
+    db.todos.create_index([("user_id", 1), ("priority", 1), ("status", 1), ("deadline", 1), ("_id", 1)])
+
+    assert drop_superseded_indexes(db) == ["todos.user_id_1_priority_1_deadline_1"]
+    assert drop_superseded_indexes(db) == []
+
+    indexes = db.todos.index_information()
+    assert "user_id_1_priority_1_deadline_1" not in indexes
+    assert "user_id_1_priority_1_status_1_deadline_1__id_1" in indexes
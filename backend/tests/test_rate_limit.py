@@ -0,0 +1,89 @@
+from fastapi.testclient import TestClient
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+import app.core.rate_limit as rate_limit_module
+import app.main as main_module
+from app.core.config import settings
+from app.core.rate_limit import BucketConfig, MemoryRateLimitBackend, MongoRateLimitBackend
+
+
+def login(client, headers=None):
+    return client.post(
+        "/api/auth/login",
+        json={"email": "nobody@example.com", "password": "whatever"},
+        headers=headers,
+    )
+
+
+def test_memory_bucket_allows_burst_then_refills():
+    backend = MemoryRateLimitBackend()
+    config = BucketConfig(capacity=2, refill_rate=1)
+
+    assert backend.consume("k", config, now=0) == 0
+    assert backend.consume("k", config, now=0) == 0
+    assert backend.consume("k", config, now=0) > 0
+    assert backend.consume("k", config, now=1) == 0
+
+
+def test_memory_backend_forgets_least_recent_keys():
+    backend = MemoryRateLimitBackend(max_keys=2)
+    config = BucketConfig(capacity=1, refill_rate=1)
+
+    for key in ("a", "b", "c"):
+        backend.consume(key, config, now=0)
+
+    # "a" was evicted, so it starts again with a full bucket
+    assert backend.consume("a", config, now=0) == 0
+    assert backend.consume("c", config, now=0) > 0
+
+
+def test_mongo_bucket_is_shared(db, monkeypatch):
+    monkeypatch.setattr(rate_limit_module, "get_database", lambda: db)
+    config = BucketConfig(capacity=2, refill_rate=1)
+
+    # Two backend instances stand in for two workers sharing one store
+    worker_a, worker_b = MongoRateLimitBackend(), MongoRateLimitBackend()
+    assert worker_a.consume("k", config, now=100) == 0
+    assert worker_b.consume("k", config, now=100) == 0
+    assert worker_a.consume("k", config, now=100) > 0
+    assert worker_b.consume("k", config, now=101) == 0
+
+
+def test_auth_routes_return_429_with_retry_after(client):
+    for _ in range(settings.RATE_LIMIT_AUTH_BURST):
+        assert login(client).status_code == 401
+
+    res = login(client)
+    assert res.status_code == 429
+    assert int(res.headers["Retry-After"]) >= 1
+
+
+def test_todo_bucket_is_separate_from_auth(client):
+    for _ in range(settings.RATE_LIMIT_AUTH_BURST):
+        login(client)
+    assert login(client).status_code == 429
+
+    # Health is unthrottled and the todos bucket is untouched by auth traffic
+    assert client.get("/health").status_code == 200
+    assert client.get("/api/todos/").status_code in (401, 403)
+
+
+def test_auth_bucket_is_keyed_by_forwarded_client_ip(client):
+    # What uvicorn does when the connecting proxy is listed in FORWARDED_ALLOW_IPS
+    proxied = TestClient(ProxyHeadersMiddleware(main_module.app, trusted_hosts="*"))
+    first = {"X-Forwarded-For": "203.0.113.1"}
+    second = {"X-Forwarded-For": "203.0.113.2"}
+
+    for _ in range(settings.RATE_LIMIT_AUTH_BURST):
+        login(proxied, first)
+    assert login(proxied, first).status_code == 429
+    assert login(proxied, second).status_code == 401
+
+
+def test_admission_control_sheds_load(client, monkeypatch):
+    monkeypatch.setattr(rate_limit_module.admission, "limit", 1)
+    monkeypatch.setattr(rate_limit_module.admission, "in_flight", 1)
+
+    res = client.get("/health")
+    assert res.status_code == 503
+    assert res.headers["Retry-After"] == "1"
@@ -0,0 +1,206 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+
+import app.core.reminders as reminders_module
+from app.core.reminders import DeadlineScheduler
+
+NOW = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def ts(dt):
+    return dt.timestamp()
+
+
+def make_todo(db, minutes, status="not_started", user_id="u1", **fields):
+    doc = {
+        "_id": ObjectId(),
+        "user_id": user_id,
+        "status": status,
+        "deadline": NOW + timedelta(minutes=minutes),
+        **fields,
+    }
+    if status is None:
+        del doc["status"]
+    db.todos.insert_one(doc)
+    return doc
+
+
+def make_scheduler(db, monkeypatch, **kwargs):
+    monkeypatch.setattr(reminders_module, "get_database", lambda: db)
+    scheduler = DeadlineScheduler(
+        due_soon=timedelta(minutes=30), horizon=timedelta(hours=2), **kwargs
+    )
+    scheduler.rebuild(now=ts(NOW))
+    return scheduler
+
+
+def event_types(events):
+    return [(e["type"], e["todo_id"]) for e in events]
+
+
+def test_rebuild_loads_only_open_deadlines_inside_horizon(db, monkeypatch):
+    soon = make_todo(db, 60)
+    make_todo(db, 60, status="finished")
+    make_todo(db, 60, status=None, completed=True)  # legacy finished todo
+    make_todo(db, 600)
+    make_todo(db, -10)
+
+    scheduler = make_scheduler(db, monkeypatch)
+    assert scheduler.pending == 1
+
+    assert scheduler.pop_due(now=ts(NOW + timedelta(minutes=29))) == []
+    assert event_types(scheduler.pop_due(now=ts(NOW + timedelta(minutes=30)))) == [
+        ("due_soon", str(soon["_id"]))
+    ]
+    assert event_types(scheduler.pop_due(now=ts(NOW + timedelta(minutes=60)))) == [
+        ("overdue", str(soon["_id"]))
+    ]
+    assert scheduler.pending == 0
+
+
+def test_writes_reschedule_and_cancel(db, monkeypatch):
+    scheduler = make_scheduler(db, monkeypatch)
+    todo = {"_id": ObjectId(), "user_id": "u1", "status": "not_started",
+            "deadline": NOW + timedelta(minutes=10)}
+
+    # Deadline already inside the due-soon window: warn immediately
+    scheduler.schedule(todo, now=ts(NOW))
+    assert event_types(scheduler.pop_due(now=ts(NOW))) == [("due_soon", str(todo["_id"]))]
+
+    # Moving the deadline drops the old overdue event
+    todo["deadline"] = NOW + timedelta(minutes=90)
+    scheduler.schedule(todo, now=ts(NOW))
+    assert scheduler.pop_due(now=ts(NOW + timedelta(minutes=15))) == []
+
+    scheduler.cancel(str(todo["_id"]))
+    assert scheduler.pop_due(now=ts(NOW + timedelta(hours=2))) == []
+
+
+def test_finishing_a_todo_stops_reminders(db, monkeypatch):
+    scheduler = make_scheduler(db, monkeypatch)
+    todo = make_todo(db, 60)
+    scheduler.rebuild(now=ts(NOW))
+
+    todo["status"] = "finished"
+    scheduler.schedule(todo, now=ts(NOW))
+    assert scheduler.pop_due(now=ts(NOW + timedelta(hours=2))) == []
+
+
+def test_max_pending_bounds_memory_and_refill_catches_up(db, monkeypatch):
+    first = make_todo(db, 40)
+    second = make_todo(db, 50)
+
+    scheduler = make_scheduler(db, monkeypatch, max_pending=1)
+    assert scheduler.pending == 1
+
+    events = scheduler.pop_due(now=ts(NOW + timedelta(minutes=45)))
+    assert ("overdue", str(first["_id"])) in event_types(events)
+
+    scheduler.refill(now=ts(NOW + timedelta(minutes=45)))
+    events = scheduler.pop_due(now=ts(NOW + timedelta(minutes=50)))
+    assert ("overdue", str(second["_id"])) in event_types(events)
+
+
+def test_api_writes_feed_the_running_scheduler(client, auth_headers):
+    deadline = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    todo = client.post(
+        "/api/todos/",
+        json={"title": "Soon", "deadline": deadline.isoformat()},
+        headers=auth_headers,
+    ).json()
+    assert reminders_module.deadline_scheduler.pending == 1
+
+    client.delete(f"/api/todos/{todo['id']}", headers=auth_headers)
+    assert reminders_module.deadline_scheduler.pending == 0
+
+
+def test_change_feed_picks_up_writes_from_other_processes(db, monkeypatch):
+    scheduler = make_scheduler(db, monkeypatch)
+    todo = make_todo(db, 60, updated_at=NOW + timedelta(minutes=1))
+
+    scheduler.poll_changes(now=ts(NOW + timedelta(minutes=2)))
+    assert scheduler.pending == 1
+
+    db.todos.update_one(
+        {"_id": todo["_id"]},
+        {"$set": {"status": "finished", "updated_at": NOW + timedelta(minutes=3)}},
+    )
+    scheduler.poll_changes(now=ts(NOW + timedelta(minutes=4)))
+    assert scheduler.pop_due(now=ts(NOW + timedelta(hours=2))) == []
+
+
+def test_confirm_drops_events_for_todos_changed_elsewhere(db, monkeypatch):
+    kept = make_todo(db, 40)
+    deleted = make_todo(db, 40)
+    finished = make_todo(db, 40)
+    moved = make_todo(db, 40)
+    scheduler = make_scheduler(db, monkeypatch)
+
+    # Writes from an HTTP worker the change feed has not seen yet
+    db.todos.delete_one({"_id": deleted["_id"]})
+    db.todos.update_one({"_id": finished["_id"]}, {"$set": {"status": "finished"}})
+    db.todos.update_one({"_id": moved["_id"]}, {"$set": {"deadline": NOW + timedelta(hours=5)}})
+
+    events = scheduler.pop_due(now=ts(NOW + timedelta(minutes=45)))
+    assert len(events) == 8
+    assert event_types(scheduler.confirm(events)) == [
+        ("due_soon", str(kept["_id"])),
+        ("overdue", str(kept["_id"])),
+    ]
+
+
+def test_writes_respect_max_pending(db, monkeypatch):
+    scheduler = make_scheduler(db, monkeypatch, max_pending=2)
+    todos = [
+        {"_id": ObjectId(), "user_id": "u1", "status": "not_started",
+         "deadline": NOW + timedelta(minutes=40 + i)}
+        for i in range(5)
+    ]
+    for todo in todos:
+        db.todos.insert_one(todo)
+        scheduler.schedule(todo, now=ts(NOW))
+    assert scheduler.pending == 2
+
+    # The rest is loaded once reminders drain
+    scheduler.pop_due(now=ts(NOW + timedelta(minutes=41)))
+    scheduler.refill(now=ts(NOW + timedelta(minutes=41)))
+    assert {todo_id for todo_id in scheduler._tracked} == {str(t["_id"]) for t in todos[2:4]}
+
+
+class ListSink:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+
+def test_database_errors_do_not_stop_the_loop(db, monkeypatch, capsys):
+    calls = []
+
+    def flaky_get_database():
+        calls.append(1)
+        if len(calls) in (2, 3):
+            raise RuntimeError("mongo blip")
+        return db
+
+    monkeypatch.setattr(reminders_module, "get_database", flaky_get_database)
+    todo = {"_id": ObjectId(), "user_id": "u1", "status": "not_started",
+            "deadline": datetime.now(timezone.utc) + timedelta(seconds=0.3)}
+    db.todos.insert_one(todo)
+    sink = ListSink()
+    scheduler = DeadlineScheduler(sink=sink, poll_interval=0.05)
+
+    async def scenario():
+        scheduler.start()
+        await asyncio.sleep(0.8)
+        alive = not scheduler._task.done()
+        await scheduler.stop()
+        return alive
+
+    assert asyncio.run(scenario())
+    assert "Reminder scheduler failed: mongo blip" in capsys.readouterr().out
+    assert event_types(sink.events) == [("overdue", str(todo["_id"]))]
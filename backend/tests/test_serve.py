@@ -0,0 +1,110 @@
+import os
+
+from fastapi.testclient import TestClient
+
+import app.core.counters as counters_module
+import app.main as main_module
+import app.serve as serve_module
+from app.core.reminders import deadline_scheduler
+
+
+class FakeProcess:
+    started = []
+
+    def __init__(self, target, name):
+        self.target = target
+        self.name = name
+
+    def start(self):
+        FakeProcess.started.append(self)
+
+    def terminate(self):
+        pass
+
+    def join(self, timeout=None):
+        pass
+
+
+class FakeContext:
+    Process = FakeProcess
+
+
+class FakeSupervisor:
+    runs = []
+
+    def __init__(self, config, target, sockets):
+        self.config = config
+
+    def run(self):
+        FakeSupervisor.runs.append(
+            {"config": self.config, "background_jobs": os.environ.get("BACKGROUND_JOBS")}
+        )
+
+
+def serve(monkeypatch, workers):
+    monkeypatch.setattr(serve_module, "Multiprocess", FakeSupervisor)
+    monkeypatch.setattr(serve_module.uvicorn.Config, "bind_socket", lambda self: None)
+    monkeypatch.setattr(serve_module.multiprocessing, "get_context", lambda method: FakeContext)
+    # Both are restored after the test
+    monkeypatch.setenv("BACKGROUND_JOBS", "true")
+    monkeypatch.setattr(serve_module.settings, "BACKGROUND_JOBS", True)
+    monkeypatch.setattr(serve_module.settings, "WORKERS", workers)
+    monkeypatch.setattr(serve_module.settings, "JOBS_PROCESS", True)
+    monkeypatch.setattr(serve_module.settings, "MAX_REQUESTS_PER_WORKER", 0)
+    FakeProcess.started.clear()
+    FakeSupervisor.runs.clear()
+
+    serve_module.main()
+
+    (run,) = FakeSupervisor.runs
+    return run
+
+
+def test_serve_passes_settings_to_uvicorn(monkeypatch):
+    run = serve(monkeypatch, workers=3)
+    config = run["config"]
+
+    assert config.app == "app.main:app"
+    assert config.workers == 3
+    assert config.loop == "uvloop"
+    assert config.http == "httptools"
+    assert config.limit_max_requests is None
+    assert config.proxy_headers is True
+    assert config.forwarded_allow_ips == serve_module.settings.FORWARDED_ALLOW_IPS
+
+    # One jobs process for the whole deployment; the HTTP workers run none
+    assert [p.target for p in FakeProcess.started] == [serve_module.jobs.main]
+    assert run["background_jobs"] == "false"
+
+
+def test_single_worker_is_supervised_without_background_jobs(monkeypatch):
+    run = serve(monkeypatch, workers=1)
+
+    # Served by a spawned, restartable worker rather than in this process
+    assert run["config"].workers == 1
+    assert run["background_jobs"] == "false"
+    assert serve_module.settings.BACKGROUND_JOBS is False
+    assert len(FakeProcess.started) == 1
+
+
+def test_http_worker_without_background_jobs_starts_no_scheduler(db, monkeypatch):
+    reconciled = []
+    monkeypatch.setattr(main_module, "connect_to_mongo", lambda: None)
+    monkeypatch.setattr(main_module, "close_mongo_connection", lambda: None)
+    monkeypatch.setattr(counters_module, "reconcile_counters", lambda: reconciled.append(1))
+    monkeypatch.setattr(main_module.settings, "BACKGROUND_JOBS", False)
+
+    with TestClient(main_module.app) as c:
+        assert c.get("/health").status_code == 200
+        assert deadline_scheduler._task is None
+
+    assert reconciled == []
+
+
+def test_worker_count_follows_cpu_affinity(monkeypatch):
+    monkeypatch.setattr(serve_module.settings, "WORKERS", 0)
+    monkeypatch.setattr(serve_module.os, "sched_getaffinity", lambda pid: {0, 1}, raising=False)
+    assert serve_module.worker_count() == 2
+
+    monkeypatch.setattr(serve_module.settings, "WORKERS", 5)
+    assert serve_module.worker_count() == 5